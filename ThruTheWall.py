@@ -6,25 +6,56 @@
 # constants for direction magic numbers.
 #
 # Minimal logic changes:
-# - Introduced named direction constants and a `canonical` helper to map variant
-#   codes to canonical directions. This keeps behavior identical while making
-#   conditions readable.
+# - Introduced named direction constants (dense indices 0..5) in place of the
+#   BASIC routine numbers, with a `from_basic_code` helper that maps a BASIC
+#   code, including variants such as 106, to its direction.
 # - Fixed missing `global tt` in game_over (was causing UnboundLocalError).
-#
-# Suggested future work: convert globals into a GameState dataclass.
+# - The BASIC globals now live on a `GameState` dataclass passed to the game
+#   functions, rather than being module globals.
 
 import pygame
 import random
 import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+
+# Numba is optional: when installed, the per-frame movement/collision step is
+# compiled to native code; otherwise the same functions run as plain Python.
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback no-op replacement for `numba.njit`."""
+        return lambda f: f
 
 # --- Pygame Setup ---
 pygame.init()
 
+# Pygame names used by the per-frame game loop, bound once so each frame does
+# a single global lookup instead of resolving `pygame.<module>.<name>`.
+_K_O = pygame.K_o
+_K_P = pygame.K_p
+_K_LSHIFT = pygame.K_LSHIFT
+_K_RSHIFT = pygame.K_RSHIFT
+_QUIT = pygame.QUIT
+_KEY_GET_PRESSED = pygame.key.get_pressed
+_EVENT_GET = pygame.event.get
+_EVENT_CLEAR = pygame.event.clear
+_DISPLAY_UPDATE = pygame.display.update
+
 # Constants for the original game's screen/grid size
 # ZX Spectrum screen is 32 columns x 24 rows (approx)
 SCREEN_WIDTH, SCREEN_HEIGHT = 640, 480
 GRID_SIZE = 20
-SCREEN = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+# SCALED renders through an SDL texture (letting the driver present frames on
+# the GPU) and DOUBLEBUF asks for a back buffer. vsync is requested as well but
+# isn't available on every driver, so fall back to the same mode without it.
+# CLOCK.tick() still caps the frame rate either way.
+_DISPLAY_FLAGS = pygame.SCALED | pygame.DOUBLEBUF
+try:
+    SCREEN = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), _DISPLAY_FLAGS, vsync=1)
+except pygame.error:
+    SCREEN = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), _DISPLAY_FLAGS)
 pygame.display.set_caption("Thru' The Wall (Pygame Conversion)")
 
 # Colors (Approximating Spectrum colors)
@@ -38,40 +69,100 @@ YELLOW = (200, 200, 0)
 FONT = pygame.font.Font(None, 36)
 SMALL_FONT = pygame.font.Font(None, 24)
 
+# A single clock for frame pacing; tick() relies on the time of the previous
+# call, so it must persist across frames rather than be recreated each time.
+CLOCK = pygame.time.Clock()
+
+# Bound method of a private generator, used for the ball's starting column
+_randrange = random.Random().randrange
+
+# --- Text surface cache ---
+# Rendering TrueType text is one of the more expensive per-frame operations,
+# and most strings drawn here (labels, the current round, a score that only
+# changes on paddle hits) are identical from one frame to the next. Rendered
+# surfaces are kept in a small LRU cache keyed by font, text and color.
+_TEXT_CACHE_MAX = 128
+_TEXT_CACHE = OrderedDict()
+
+def render_cached(font, text, color):
+    """Return a rendered (antialiased) surface for `text`, reusing prior renders."""
+    key = (id(font), text, color)
+    surface = _TEXT_CACHE.get(key)
+    if surface is None:
+        surface = font.render(text, True, color)
+        _TEXT_CACHE[key] = surface
+        if len(_TEXT_CACHE) > _TEXT_CACHE_MAX:
+            _TEXT_CACHE.popitem(last=False)  # evict least recently used
+    else:
+        _TEXT_CACHE.move_to_end(key)
+    return surface
+
 # --- Direction constants (replace magic numbers used in the BASIC port) ---
-# The original BASIC used values such as 100,106,120,125,... to encode
-# movement routines/directions. We keep those integer values but expose
-# canonical names for readability and a mapping for variant codes.
-D_DOWN_RIGHT = 100
-D_UP_RIGHT = 120
-D_UP_LEFT = 140
-D_DOWN_LEFT = 160
-D_UP = 180
-D_DOWN = 200
-
-# Some BASIC variants used near-duplicates like 106, 125, 145, 166, 206.
-# Map those to canonical directions for easier checks.
-_VARIANT_TO_CANON = {
-    106: D_DOWN_RIGHT,
-    125: D_UP_RIGHT,
-    145: D_UP_LEFT,
-    166: D_DOWN_LEFT,
-    206: D_DOWN,
+# The original BASIC used values such as 100,106,120,125,... (the line numbers
+# of its movement routines) to encode directions. Here directions are dense
+# indices 0..5 so per-frame logic can use tuple indexing and bit tests.
+D_DOWN_RIGHT = 0  # BASIC 100
+D_UP_RIGHT = 1    # BASIC 120
+D_UP_LEFT = 2     # BASIC 140
+D_DOWN_LEFT = 3   # BASIC 160
+D_UP = 4          # BASIC 180
+D_DOWN = 5        # BASIC 200
+
+# Every BASIC direction code mapped to its direction index. Some BASIC
+# variants used near-duplicates like 106, 125, 145, 166, 206.
+_DIR = {
+    100: D_DOWN_RIGHT, 106: D_DOWN_RIGHT,
+    120: D_UP_RIGHT, 125: D_UP_RIGHT,
+    140: D_UP_LEFT, 145: D_UP_LEFT,
+    160: D_DOWN_LEFT, 166: D_DOWN_LEFT,
+    180: D_UP,
+    200: D_DOWN, 206: D_DOWN,
 }
 
-def canonical(g):
-    """Return canonical direction integer for potentially-variant code g."""
-    return _VARIANT_TO_CANON.get(g, g)
+def from_basic_code(code):
+    """Return the direction index for BASIC direction code `code` (e.g. 100 or 106).
 
-# --- Global Game Variables (from BASIC) ---
-tt = -1  # Total games counter (Line 10)
-t = 0    # Score counter (Line 250)
-a = 13   # Paddle position (x-coordinate, BASIC 'a')
-w = 0    # Wall break flag (Line 112,132,152,172)
-g = D_DOWN  # Current movement routine index (direction)
-r = 0    # Current round (Line 50)
-score = 0
-running = True
+    The game logic only ever works with direction indices; this is for
+    relating them back to the routine numbers in ThruTheWall.bas.
+    """
+    return _DIR[code]
+
+# Per-direction movement deltas, indexed by direction.
+_DM = (1, -1, -1, 1, -1, 1)  # row (m) change
+_DN = (1, 1, -1, -1, 0, 0)   # column (n) change
+
+def _mask(*directions):
+    """Return a bitmask with the bit for each direction index set."""
+    return sum(1 << d for d in directions)
+
+# Direction groups used by the boundary checks, tested as `mask >> g & 1`
+_IS_RIGHT = _mask(D_DOWN_RIGHT, D_UP_RIGHT)
+_IS_LEFT = _mask(D_UP_LEFT, D_DOWN_LEFT)
+_IS_UP = _mask(D_UP_RIGHT, D_UP_LEFT, D_UP)
+
+# Rebound direction indexed by where the ball hits the paddle (n - a), left to
+# right across its 4 cells: the left half favors left, then straight up, then right.
+_PADDLE_REBOUND = (D_UP_LEFT, D_UP_LEFT, D_UP, D_UP_RIGHT)
+
+# --- Game State (the BASIC program's global variables) ---
+@dataclass(slots=True)
+class GameState:
+    """Mutable game variables, named after their BASIC counterparts."""
+    tt: int = -1      # Total games counter (Line 10)
+    t: int = 0        # Score counter (Line 250)
+    a: int = 13       # Paddle position (x-coordinate, BASIC 'a')
+    w: int = 0        # Wall break flag (Line 112,132,152,172)
+    g: int = D_DOWN   # Current movement routine index (direction)
+    r: int = 0        # Current round (Line 50)
+    running: bool = True
+    base_score: int = -600  # tt * 600, kept in step with tt by count_game()
+
+    def count_game(self):
+        """Increment the total games counter `tt` and its score base."""
+        self.tt += 1
+        self.base_score = self.tt * 600  # scoring formula carried from BASIC
+
+STATE = GameState()
 
 # Convert BASIC grid coordinates to Pygame pixel coordinates
 def to_pixels(x, y):
@@ -85,252 +176,274 @@ def to_pixels(x, y):
 
 # --- Drawing Functions ---
 
-def draw_background():
-    """Render static background elements (paper, wall area, play boundary)."""
-    SCREEN.fill(WHITE)  # PAPER 7 in the BASIC port
+# Rects reused by the drawing code instead of building fresh tuples per call
+_WALL_RECT = pygame.Rect(0, 0, SCREEN_WIDTH, 120)
+_FRAME_RECT = pygame.Rect(0, 0, SCREEN_WIDTH, 420)
+_PADDLE_RECT = pygame.Rect(0, 21 * GRID_SIZE, 4 * GRID_SIZE, GRID_SIZE)  # BASIC line ~21
+
+def _build_ball_surface():
+    """Rasterize the ball once onto a transparent grid-cell-sized surface."""
+    surface = pygame.Surface((GRID_SIZE, GRID_SIZE), pygame.SRCALPHA).convert_alpha()
+    pygame.draw.circle(surface, RED, (GRID_SIZE // 2, GRID_SIZE // 2), GRID_SIZE // 3)
+    return surface
+
+_BALL_SURFACE = _build_ball_surface()
+
+def _build_background():
+    """Render the static background elements (paper, wall area, play boundary) once."""
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    surface.fill(WHITE)  # PAPER 7 in the BASIC port
     # Draw the 'Wall' region (simulating BASIC lines 30-40)
-    pygame.draw.rect(SCREEN, CYAN, (0, 0, SCREEN_WIDTH, 120))
+    pygame.draw.rect(surface, CYAN, _WALL_RECT)
     # Draw the play area boundary (frame)
-    pygame.draw.rect(SCREEN, BLACK, (0, 0, SCREEN_WIDTH, 420), 2)
+    pygame.draw.rect(surface, BLACK, _FRAME_RECT, 2)
+    return surface
+
+BG_SURFACE = _build_background()
+
+def draw_background():
+    """Repaint the whole screen with the pre-rendered static background."""
+    SCREEN.blit(BG_SURFACE, (0, 0))
+
+def restore_background(rects):
+    """Repaint only the given screen regions from the static background."""
+    for rect in rects:
+        SCREEN.blit(BG_SURFACE, rect, rect)
 
 def draw_paddle(x):
-    """Draw the paddle at BASIC paddle position `x`.
+    """Draw the paddle at BASIC paddle position `x` and return its screen rect.
 
     Paddle 'a' is an integer roughly in 1..28; we scale it by GRID_SIZE.
+    The shared `_PADDLE_RECT` is moved in place; the returned rect is the
+    separate one produced by `pygame.draw.rect`, so it is safe to keep.
     """
-    paddle_y = 21  # BASIC line ~21
-    x_pos = x * GRID_SIZE
-    paddle_width = 4 * GRID_SIZE
-    paddle_height = GRID_SIZE
-    pygame.draw.rect(SCREEN, BLUE, (x_pos, paddle_y * GRID_SIZE, paddle_width, paddle_height))
+    _PADDLE_RECT.x = x * GRID_SIZE
+    return pygame.draw.rect(SCREEN, BLUE, _PADDLE_RECT)
 
 def draw_ball(m, n):
-    """Draw the ball at BASIC coordinates (m, n)."""
+    """Draw the ball at BASIC coordinates (m, n) and return its screen rect."""
     x, y = to_pixels(n, m)  # note ordering preserved from original code
-    pygame.draw.circle(SCREEN, RED, (x, y), GRID_SIZE // 3)
+    return SCREEN.blit(_BALL_SURFACE, (x - GRID_SIZE // 2, y - GRID_SIZE // 2))
 
-def draw_status():
-    """Render score and round status at the bottom of the screen."""
-    global t, tt
-    current_score = tt * 600 + t  # scoring formula carried from BASIC
-    score_text = FONT.render(f"SCORE: {current_score}", True, BLACK)
-    round_text = FONT.render(f"ROUND: {r}", True, BLACK)
-    SCREEN.blit(score_text, (20, SCREEN_HEIGHT - 50))
-    SCREEN.blit(round_text, (SCREEN_WIDTH - 150, SCREEN_HEIGHT - 50))
+def draw_status(state):
+    """Render score and round status at the bottom of the screen.
+
+    Returns the screen rects covered by the two text surfaces.
+    """
+    current_score = state.base_score + state.t
+    score_text = render_cached(FONT, f"SCORE: {current_score}", BLACK)
+    round_text = render_cached(FONT, f"ROUND: {state.r}", BLACK)
+    return [
+        SCREEN.blit(score_text, (20, SCREEN_HEIGHT - 50)),
+        SCREEN.blit(round_text, (SCREEN_WIDTH - 150, SCREEN_HEIGHT - 50)),
+    ]
 
 # --- Movement/Collision Logic (Based on GOTO/GOSUB) ---
+# These are pure integer functions so they can be compiled with Numba; `step`
+# fuses them into the single call made once per frame.
 
+@njit("UniTuple(int64, 2)(int64, int64, int64)", cache=True)
 def move_ball(m, n, g):
-    """Return new (m, n) after moving the ball according to direction `g`.
+    """Return new (m, n) after moving the ball according to direction `g`."""
+    return m + _DM[g], n + _DN[g]
 
-    The direction is canonicalized to support the BASIC variant codes.
-    """
-    cg = canonical(g)
-
-    # Down-Right
-    if cg == D_DOWN_RIGHT:
-        m += 1
-        n += 1
-    # Up-Right
-    elif cg == D_UP_RIGHT:
-        m -= 1
-        n += 1
-    # Up-Left
-    elif cg == D_UP_LEFT:
-        m -= 1
-        n -= 1
-    # Down-Left
-    elif cg == D_DOWN_LEFT:
-        m += 1
-        n -= 1
-    # Up
-    elif cg == D_UP:
-        m -= 1
-    # Down
-    elif cg == D_DOWN:
-        m += 1
-
-    return m, n
-
-def check_boundaries(m, n, g, w):
+@njit("int64(int64, int64, int64)", cache=True)
+def check_boundaries(m, n, g):
     """Adjust direction `g` when the ball hits screen boundaries.
 
     Behavior mirrors BASIC checks:
     - If n > 30 and ball moving right, flip to move left.
     - If n < 1 and ball moving left, flip to move right.
     - If m < 1 (top) and moving upward, send the ball down.
-    `w` is the wall-break flag kept for parity with the BASIC logic.
+    The BASIC wall-break flag (`GameState.w`) is never set in this port, so
+    it is not consulted here.
     """
-    cg = canonical(g)
-
     # Right wall: if column n goes past ~30 and was moving right -> go left
     if n > 30:
-        if cg in (D_DOWN_RIGHT, D_UP_RIGHT):
+        if _IS_RIGHT >> g & 1:
             return D_DOWN_LEFT  # 160 in BASIC
 
     # Left wall: if column n < 1 and was moving left -> go right
     elif n < 1:
-        if cg in (D_UP_LEFT, D_DOWN_LEFT):
+        if _IS_LEFT >> g & 1:
             return D_DOWN_RIGHT  # 100 in BASIC
 
     # Top of screen: if m < 1 and was moving upward -> send down
     if m < 1:
-        if cg in (D_UP_RIGHT, D_UP_LEFT, D_UP):
+        if _IS_UP >> g & 1:
             # In the original, hitting some top-wall locations set w=1 and caused different
             # outcomes; here we simplify to a downward bounce.
             return D_DOWN
 
     return g
 
+@njit("UniTuple(int64, 2)(int64, int64, int64, int64)", cache=True)
 def check_paddle_collision(m, n, a, g):
-    """Detect paddle hit and return updated direction `g`.
+    """Detect paddle hit and return (updated direction `g`, points scored).
 
     If the ball strikes the paddle row (m == 20) and column is within
-    paddle span [a, a+3], score `t` is incremented and direction is changed
-    based on the hit position (left/center/right).
+    paddle span [a, a+3], 10 points are scored (BASIC Line 250) and the
+    direction is changed based on the hit position (left/center/right).
     """
-    global t, tt
     if m == 20:
-        if a <= n <= a + 3:
-            t += 10  # BASIC Line 250: score increment
-            # Determine new direction based on where on paddle the ball hit
-            if n == a or n == a + 1:
-                return D_UP_LEFT   # favor left rebound
-            elif n == a + 2:
-                return D_UP        # straight up
-            elif n == a + 3 or n == a + 4:
-                return D_UP_RIGHT  # favor right rebound
-    return g
+        offset = n - a  # where on the paddle the ball hit
+        if 0 <= offset < len(_PADDLE_REBOUND):
+            return _PADDLE_REBOUND[offset], 10
+    return g, 0
+
+@njit("UniTuple(int64, 4)(int64, int64, int64, int64)", cache=True)
+def step(m, n, g, a):
+    """Advance the ball one frame: paddle collision, boundaries, then move.
+
+    Returns (m, n, g, scored) where `scored` is the points earned this frame.
+    """
+    g, scored = check_paddle_collision(m, n, a, g)
+    g = check_boundaries(m, n, g)
+    m, n = move_ball(m, n, g)
+    return m, n, g, scored
+
+# --- Pre-rendered Screens ---
+
+def _blit_centered(surface, text, y):
+    """Blit `text` horizontally centered on `surface` at height `y`."""
+    surface.blit(text, (SCREEN_WIDTH // 2 - text.get_width() // 2, y))
+
+def _build_title_surface():
+    """Compose the full title screen (Lines 310-530 mapping) once."""
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    surface.fill(WHITE)
+    _blit_centered(surface, FONT.render("THRO' THE WALL (Pygame)", True, BLUE), 50)
+    surface.blit(SMALL_FONT.render("O/P to move left/right", True, BLACK), (50, 200))
+    surface.blit(SMALL_FONT.render("CAPS SHIFT for extra zip", True, BLACK), (50, 250))
+    _blit_centered(surface, FONT.render("PRESS ANY KEY TO START", True, RED), 400)
+    return surface
+
+def _build_gameover_surface():
+    """Compose the static part of the game-over screen; the score is drawn per game."""
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    surface.fill(BLACK)
+    _blit_centered(surface, FONT.render("GAME OVER", True, WHITE), SCREEN_HEIGHT // 3)
+    _blit_centered(surface, SMALL_FONT.render("Press 'Y' to play again, 'N' to exit", True, WHITE),
+                   SCREEN_HEIGHT // 3 + 150)
+    return surface
+
+_TITLE_SURFACE = _build_title_surface()
+_GAMEOVER_SURFACE = _build_gameover_surface()
 
 # --- Game Loops ---
 
-def game_over():
+def game_over(state):
     """Handle end-of-game UI and wait for restart/exit decision.
 
-    Displays final score and listens for Y (restart) or N (exit).
+    Displays final score and listens for Y (restart) or N (exit). Returns
+    True to play again and False to exit.
     """
-    global running, tt  # tt is modified here
-    tt += 1  # increment total games counter (BASIC Line 240)
-
-    SCREEN.fill(BLACK)
-    final_score = tt * 600 + t
+    state.count_game()  # increment total games counter (BASIC Line 240)
 
-    game_over_text = FONT.render("GAME OVER", True, WHITE)
-    score_display = FONT.render(f"FINAL SCORE: {final_score}", True, WHITE)
-    replay_text = SMALL_FONT.render("Press 'Y' to play again, 'N' to exit", True, WHITE)
+    final_score = state.base_score + state.t
 
-    SCREEN.blit(game_over_text, (SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, SCREEN_HEIGHT // 3))
-    SCREEN.blit(score_display, (SCREEN_WIDTH // 2 - score_display.get_width() // 2, SCREEN_HEIGHT // 3 + 50))
-    SCREEN.blit(replay_text, (SCREEN_WIDTH // 2 - replay_text.get_width() // 2, SCREEN_HEIGHT // 3 + 150))
+    # Only the final score changes between games; the rest is pre-rendered
+    SCREEN.blit(_GAMEOVER_SURFACE, (0, 0))
+    _blit_centered(SCREEN, render_cached(FONT, f"FINAL SCORE: {final_score}", WHITE), SCREEN_HEIGHT // 3 + 50)
     pygame.display.flip()
 
-    # Wait for user decision
+    # Wait for user decision (only QUIT/KEYDOWN matter; drop everything else).
+    # clear(pump=False) discards only what get() already saw, so events that
+    # arrive in between are kept for the next pass.
     while True:
-        for event in pygame.event.get():
+        events = pygame.event.get([pygame.QUIT, pygame.KEYDOWN])
+        pygame.event.clear(pump=False)
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_y:
-                    # Restart the main game loop
-                    main_game_loop()
+                    return True
                 elif event.key == pygame.K_n:
-                    running = False
-                    return
+                    return False
 
-def main_game_loop():
-    """Run the main gameplay loop: rounds, paddle control, ball movement, drawing."""
-    global tt, t, a, w, g, r, running
-
-    tt += 1
-    t = 0
+def main_game_loop(state):
+    """Play one game: six rounds (one ball each) of paddle control, ball movement and drawing."""
+    state.count_game()
+    state.t = 0
 
     # Outer loop: FOR r = 1 TO 6 in the BASIC original
     for r in range(1, 7):
-        # Initialize ball and paddle for this round
+        state.r = r
+        # Initialize ball and paddle for this round. The fields updated every
+        # frame are kept in locals and written back to `state` after the round.
         m = 10
-        n = 8 + random.randint(0, 13)
+        n = 8 + _randrange(14)  # column 8..21
         g = D_DOWN
         a = 13
-        w = 0
+        state.w = 0
+
+        # Paint the full background once per round; after that only the
+        # regions covered by the previous frame's sprites are repainted.
+        draw_background()
+        pygame.display.flip()
+        dirty_rects = []
 
         # Inner loop: while the ball hasn't passed the paddle row (m <= 20)
         while m <= 20:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
+            # Only QUIT is handled here; paddle keys are read via get_pressed()
+            if _EVENT_GET(_QUIT):
+                pygame.quit()
+                sys.exit()
+            _EVENT_CLEAR(pump=False)
 
             # --- Input Handling (Lines 80-86 in BASIC mapping) ---
-            keys = pygame.key.get_pressed()
-            # 'o' (K_o): Move Left by 1
-            if keys[pygame.K_o] and a > 1:
-                a -= 1
-            # Shift + 'o': Move left faster by 2
-            if (keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT]) and keys[pygame.K_o] and a > 2:
-                a -= 2
-            # 'p': Move Right by 1
-            if keys[pygame.K_p] and a < 28:
-                a += 1
-            # Shift + 'p': Move right faster by 2
-            if (keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT]) and keys[pygame.K_p] and a < 27:
-                a += 2
+            keys = _KEY_GET_PRESSED()
+            shift = keys[_K_LSHIFT] or keys[_K_RSHIFT]
+            # 'o' (K_o) moves left, 'p' moves right; Shift doubles the step
+            delta = (-1 if keys[_K_O] else 0) + (1 if keys[_K_P] else 0)
+            if shift:
+                delta *= 2
+            a = max(1, min(28, a + delta))
 
             # --- Movement and Collision ---
-            g = check_paddle_collision(m, n, a, g)
-            g = check_boundaries(m, n, g, w)
-            m, n = move_ball(m, n, g)
+            m, n, g, scored = step(m, n, g, a)
+            state.t += scored
 
-            # --- Drawing ---
-            draw_background()
-            draw_paddle(a)
-            draw_ball(m, n)
-            draw_status()
-            pygame.display.flip()
+            # --- Drawing (dirty rects: erase last frame's sprites, draw new ones) ---
+            restore_background(dirty_rects)
+            drawn = [draw_paddle(a), draw_ball(m, n), *draw_status(state)]
+            _DISPLAY_UPDATE(dirty_rects + drawn)
+            dirty_rects = drawn
 
             # Speed control (approx 20 frames/sec)
-            pygame.time.Clock().tick(20)
-
-        # Ball missed the paddle -> exit inner loop to handle game over
-        break
-
-    # If the FOR loop completes (r == 6), the player won all rounds (message only)
-    if r == 6:
-        print("You WON the 6 rounds!")
+            CLOCK.tick(20)
 
-    game_over()
+        # Ball passed the paddle: this ball is lost, on to the next round
+        # (BASIC Lines 240-242)
+        state.a = a
+        state.g = g
 
 # --- Title Screen (Lines 310-530 mapping) ---
 def title_screen():
     """Show title and wait for any key to start the game."""
-    SCREEN.fill(WHITE)
-
-    title_text = FONT.render("THRO' THE WALL (Pygame)", True, BLUE)
-    instructions = SMALL_FONT.render("O/P to move left/right", True, BLACK)
-    zip_text = SMALL_FONT.render("CAPS SHIFT for extra zip", True, BLACK)
-    start_text = FONT.render("PRESS ANY KEY TO START", True, RED)
-
-    SCREEN.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, 50))
-    SCREEN.blit(instructions, (50, 200))
-    SCREEN.blit(zip_text, (50, 250))
-    SCREEN.blit(start_text, (SCREEN_WIDTH // 2 - start_text.get_width() // 2, 400))
+    SCREEN.blit(_TITLE_SURFACE, (0, 0))
     pygame.display.flip()
 
     waiting = True
     while waiting:
-        for event in pygame.event.get():
+        events = pygame.event.get([pygame.QUIT, pygame.KEYDOWN])
+        pygame.event.clear(pump=False)
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
             if event.type == pygame.KEYDOWN:
                 waiting = False
 
-    main_game_loop()
-
-# Entry point
+# Entry point: games are played in a loop (not by recursion) until the player
+# chooses to exit on the game-over screen.
 title_screen()
+while STATE.running:
+    main_game_loop(STATE)
+    STATE.running = game_over(STATE)
 
 # Final exit cleanup
-if not running:
-    pygame.quit()
-    sys.exit()
\ No newline at end of file
+pygame.quit()
+sys.exit()
\ No newline at end of file